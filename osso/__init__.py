@@ -14,6 +14,7 @@ from .tools import Question
 from .tools import QuestionOption
 from .tools import ask_user_question
 from .tools import bash
+from .tools import close_web_clients
 from .tools import edit
 from .tools import execute_tools
 from .tools import glob
@@ -78,6 +79,7 @@ __all__ = [
     "agent",
     "ask_user_question",
     "bash",
+    "close_web_clients",
     "edit",
     "execute_tools",
     "glob",
@@ -4,6 +4,7 @@ import json
 from typing import Any
 from collections.abc import AsyncIterator
 
+import httpx
 from openai import AsyncOpenAI
 
 from .types import Done
@@ -26,9 +27,11 @@ class LLMClient:
         api_key: str,
         model: str = "anthropic/claude-sonnet-4",
         base_url: str = "https://openrouter.ai/api/v1",
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
-        self._client = AsyncOpenAI(base_url=base_url, api_key=api_key)
+        self._client = AsyncOpenAI(base_url=base_url, api_key=api_key, http_client=http_client)
         self._model = model
+        self._owns_http_client = http_client is None
 
     def _convert_content(self, content: str | list | None) -> str | list[dict[str, Any]]:
         if content is None:
@@ -43,8 +46,14 @@ class LLMClient:
                 result.append({"type": "image_url", "image_url": {"url": item.source}})
         return result
 
-    def _to_api_messages(self, messages: list[Message]) -> list[dict[str, Any]]:
+    def _to_api_messages(
+        self,
+        messages: list[Message],
+        system: str | None = None,
+    ) -> list[dict[str, Any]]:
         result: list[dict[str, Any]] = []
+        if system:
+            result.append({"role": "system", "content": system})
         for msg in messages:
             if msg.tool_results:
                 for tr in msg.tool_results:
@@ -91,9 +100,7 @@ class LLMClient:
         return result
 
     async def stream(self, request: Request) -> AsyncIterator[Event]:
-        api_messages = self._to_api_messages(request.messages)
-        if request.system:
-            api_messages.insert(0, {"role": "system", "content": request.system})
+        api_messages = self._to_api_messages(request.messages, request.system)
 
         params: dict[str, Any] = {
             "model": self._model,
@@ -106,9 +113,12 @@ class LLMClient:
         if request.temperature is not None:
             params["temperature"] = request.temperature
 
-        content = ""
+        content_parts: list[str] = []
         tool_calls: list[ToolCall] = []
-        tool_call_map: dict[int, dict[str, Any]] = {}
+        tool_call_slots: dict[int, int] = {}
+        tool_call_ids: list[str] = []
+        tool_call_names: list[str] = []
+        tool_call_arguments: list[list[str]] = []
 
         try:
             stream = await self._client.chat.completions.create(**params)
@@ -119,32 +129,35 @@ class LLMClient:
                 delta = chunk.choices[0].delta
 
                 if delta.content:
-                    content += delta.content
+                    content_parts.append(delta.content)
                     yield TextDelta(id=request.id, text=delta.content)
 
                 if delta.tool_calls:
                     for tc_delta in delta.tool_calls:
-                        idx = tc_delta.index
-                        if idx not in tool_call_map:
-                            tool_call_map[idx] = {
-                                "id": tc_delta.id or "",
-                                "name": tc_delta.function.name if tc_delta.function else "",
-                                "arguments_json": "",
-                            }
+                        slot = tool_call_slots.get(tc_delta.index)
+                        if slot is None:
+                            slot = tool_call_slots[tc_delta.index] = len(tool_call_ids)
+                            tool_call_ids.append(tc_delta.id or "")
+                            tool_call_names.append(
+                                tc_delta.function.name if tc_delta.function else ""
+                            )
+                            tool_call_arguments.append([])
                             yield ToolCallStart(
-                                id=tool_call_map[idx]["id"],
+                                id=tool_call_ids[slot],
                                 request_id=request.id,
-                                name=tool_call_map[idx]["name"],
+                                name=tool_call_names[slot],
                             )
                         if tc_delta.function and tc_delta.function.arguments:
-                            tool_call_map[idx]["arguments_json"] += tc_delta.function.arguments
+                            tool_call_arguments[slot].append(tc_delta.function.arguments)
 
-            for tc_data in tool_call_map.values():
+            for tc_id, tc_name, tc_arguments in zip(
+                tool_call_ids, tool_call_names, tool_call_arguments
+            ):
                 try:
-                    arguments = json.loads(tc_data["arguments_json"] or "{}")
+                    arguments = json.loads("".join(tc_arguments) or "{}")
                 except json.JSONDecodeError:
                     arguments = {}
-                tc = ToolCall(id=tc_data["id"], name=tc_data["name"], arguments=arguments)
+                tc = ToolCall(id=tc_id, name=tc_name, arguments=arguments)
                 tool_calls.append(tc)
                 yield ToolCallEnd(
                     id=tc.id,
@@ -153,6 +166,7 @@ class LLMClient:
                     arguments=tc.arguments,
                 )
 
+            content = "".join(content_parts)
             yield Done(
                 id=request.id,
                 response=Response(
@@ -166,4 +180,5 @@ class LLMClient:
             yield Error(id=request.id, error=str(e))
 
     async def close(self) -> None:
-        await self._client.close()
+        if self._owns_http_client:
+            await self._client.close()
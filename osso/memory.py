@@ -47,13 +47,17 @@ class FileStorage(Storage):
 
     async def save(self, agent_id: str, checkpoint: Checkpoint) -> None:
         data = asdict(checkpoint)
-        self._file_path(agent_id).write_text(json.dumps(data, indent=2))
+        path = self._file_path(agent_id)
+        tmp_path = path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(data, indent=2))
+        tmp_path.replace(path)
 
     async def load(self, agent_id: str) -> Checkpoint | None:
-        path = self._file_path(agent_id)
-        if not path.exists():
+        try:
+            raw = self._file_path(agent_id).read_bytes()
+        except FileNotFoundError:
             return None
-        data = json.loads(path.read_text())
+        data = json.loads(raw)
         return Checkpoint(**data)
 
     async def delete(self, agent_id: str) -> None:
@@ -15,6 +15,7 @@ from osso.tools.builtin import grep
 from osso.tools.web import web_fetch
 from osso.tools.web import web_search
 from osso.tools.web import http_request
+from osso.tools.web import close_web_clients
 
 
 __all__ = [
@@ -32,4 +33,5 @@ __all__ = [
     "web_fetch",
     "web_search",
     "http_request",
+    "close_web_clients",
 ]
@@ -11,6 +11,7 @@ from osso.types import ToolCall
 from osso.types import ToolResult
 from osso.types import NullableStr
 
+from pydantic import ConfigDict
 from pydantic import Field
 from pydantic import create_model
 
@@ -42,22 +43,32 @@ class _ToolWrapper:
         self._name = name
         self._description = description
         self._model = _build_pydantic_model(fn)
+        self._tool: Tool | None = None
 
     def to_tool(self) -> Tool:
-        schema = self._model.model_json_schema()
+        if self._tool is None:
+            self._tool = self._build_tool()
+        return self._tool
+
+    def _build_tool(self) -> Tool:
+        schema = _inline_refs(self._model.model_json_schema())
         properties = {
             k: {key: val for key, val in v.items() if key != "title"}
             for k, v in schema.get("properties", {}).items()
         }
 
+        parameters = {
+            "type": "object",
+            "properties": properties,
+            "required": schema.get("required", []),
+        }
+        if "$defs" in schema:
+            parameters["$defs"] = schema["$defs"]
+
         return Tool(
             name=self._name,
             description=self._description,
-            parameters={
-                "type": "object",
-                "properties": properties,
-                "required": schema.get("required", []),
-            },
+            parameters=parameters,
             handler=self._fn,
         )
 
@@ -84,18 +95,57 @@ def _build_pydantic_model(fn: Callable) -> type:
         else:
             fields[name] = (annotation, Field(default=param.default))
 
-    return create_model(fn.__name__, **fields)
+    return create_model(fn.__name__, __config__=ConfigDict(defer_build=True), **fields)
+
+
+def _inline_refs(schema: dict[str, Any]) -> dict[str, Any]:
+    defs = schema.pop("$defs", None)
+    if not defs:
+        return schema
+
+    keep_defs = False
+    visited: set[int] = set()
+    stack: list[tuple[Any, frozenset[str]]] = [(schema, frozenset())]
+
+    while stack:
+        node, expanding = stack.pop()
+        if id(node) in visited:
+            continue
+        visited.add(id(node))
+
+        if isinstance(node, list):
+            stack.extend((item, expanding) for item in node)
+            continue
+        if not isinstance(node, dict):
+            continue
+
+        ref = node.get("$ref")
+        if isinstance(ref, str) and ref.startswith("#/$defs/"):
+            name = ref.removeprefix("#/$defs/")
+            if name in expanding or name not in defs:
+                keep_defs = True
+            else:
+                del node["$ref"]
+                for key, value in defs[name].items():
+                    node.setdefault(key, value)
+                expanding = expanding | {name}
+
+        stack.extend((value, expanding) for value in node.values())
+
+    if keep_defs:
+        schema["$defs"] = defs
+    return schema
 
 
-def _get_handler(name: str, tools: list[Callable]) -> Callable | None:
+def _get_handlers(tools: list[Callable]) -> dict[str, Callable]:
+    handlers: dict[str, Callable] = {}
     for t in tools:
         if hasattr(t, "to_tool"):
             tool_def = t.to_tool()
-            if tool_def.name == name:
-                return tool_def.handler
-        elif isinstance(t, Tool) and t.name == name:
-            return t.handler
-    return None
+            handlers.setdefault(tool_def.name, tool_def.handler)
+        elif isinstance(t, Tool):
+            handlers.setdefault(t.name, t.handler)
+    return handlers
 
 
 async def execute_tools(
@@ -103,9 +153,10 @@ async def execute_tools(
     tools: list[Callable],
 ) -> list[ToolResult]:
     results: list[ToolResult] = []
+    handlers = _get_handlers(tools)
 
     for tc in tool_calls:
-        handler = _get_handler(tc.name, tools)
+        handler = handlers.get(tc.name)
 
         if not handler:
             results.append(
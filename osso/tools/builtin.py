@@ -1,8 +1,14 @@
 from __future__ import annotations
 
 import asyncio
+import fnmatch
 import os
 import re
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
@@ -58,6 +64,42 @@ def ask_user_question(questions: list[Question]) -> dict[str, Any]:
     }
 
 
+def _read_lines(path: Path, offset: int, limit: int) -> list[str]:
+    with open(path, encoding="utf-8", errors="replace") as f:
+        window = ""
+        while offset > 0:
+            chunk = f.read(65536)
+            if not chunk:
+                return []
+
+            newlines = chunk.count("\n")
+            if newlines < offset:
+                offset -= newlines
+                continue
+
+            i = -1
+            for _ in range(offset):
+                i = chunk.find("\n", i + 1)
+            window = chunk[i + 1 :]
+            break
+
+        parts = [window]
+        newlines = window.count("\n")
+        while newlines < limit:
+            chunk = f.read(65536)
+            if not chunk:
+                break
+            parts.append(chunk)
+            newlines += chunk.count("\n")
+
+    lines = "".join(parts).split("\n")
+    if len(lines) > limit:
+        del lines[limit:]
+    elif lines[-1] == "":
+        lines.pop()
+    return lines
+
+
 @tool
 def read(file_path: str, offset: int = 0, limit: int = 2000) -> str:
     """Read a file from the filesystem. Returns contents with line numbers."""
@@ -69,14 +111,8 @@ def read(file_path: str, offset: int = 0, limit: int = 2000) -> str:
     if path.is_dir():
         raise IsADirectoryError(f"Path is a directory: {file_path}")
 
-    with open(path, encoding="utf-8", errors="replace") as f:
-        lines = f.readlines()
-
-    selected = lines[offset : offset + limit]
-
-    result = []
-    for i, line in enumerate(selected, start=offset + 1):
-        result.append(f"{i:6d}\t{line.rstrip()}")
+    selected = _read_lines(path, offset, limit)
+    result = [f"{i:6d}\t{line.rstrip()}" for i, line in enumerate(selected, start=offset + 1)]
 
     return "\n".join(result)
 
@@ -103,14 +139,18 @@ def edit(file_path: str, old_string: str, new_string: str) -> str:
 
     content = path.read_text(encoding="utf-8")
 
-    if old_string not in content:
+    start = content.find(old_string)
+    if start == -1:
         raise ValueError(f"String not found in file: {old_string[:50]}...")
 
-    count = content.count(old_string)
-    if count > 1:
-        raise ValueError(f"String appears {count} times. Provide more context to make it unique.")
+    end = start + len(old_string)
+    if content.find(old_string, max(end, 1)) != -1:
+        raise ValueError(
+            f"String appears {content.count(old_string)} times. "
+            "Provide more context to make it unique."
+        )
 
-    new_content = content.replace(old_string, new_string)
+    new_content = content[:start] + new_string + content[end:]
     path.write_text(new_content, encoding="utf-8")
 
     return f"Successfully edited {file_path}"
@@ -130,7 +170,8 @@ async def bash(command: str, cwd: NullableStr = None, timeout: int = 120) -> str
             env={**os.environ, "TERM": "dumb"},
         )
 
-        stdout, _ = await asyncio.wait_for(process.communicate(), timeout=timeout)
+        async with asyncio.timeout(timeout):
+            stdout, _ = await process.communicate()
         output = stdout.decode("utf-8", errors="replace")
 
         if process.returncode != 0:
@@ -145,6 +186,29 @@ async def bash(command: str, cwd: NullableStr = None, timeout: int = 120) -> str
         raise RuntimeError(f"Command failed: {e}")
 
 
+def _iter_paths(root: Path, pattern: str, files_only: bool = False) -> Iterator[str]:
+    head, _, name = pattern.rpartition("/")
+    if head not in ("", "**") or not name or "**" in name:
+        for p in root.glob(pattern):
+            if not files_only or p.is_file():
+                yield str(p)
+        return
+
+    match = re.compile(fnmatch.translate(name), re.IGNORECASE if os.name == "nt" else 0).match
+    directories = [str(root)]
+
+    while directories:
+        try:
+            with os.scandir(directories.pop()) as entries:
+                for entry in entries:
+                    if match(entry.name) and (not files_only or entry.is_file()):
+                        yield entry.path
+                    if head and entry.is_dir(follow_symlinks=False):
+                        directories.append(entry.path)
+        except OSError:
+            continue
+
+
 @tool
 def glob(pattern: str, path: NullableStr = None) -> str:
     """Find files matching a glob pattern."""
@@ -153,16 +217,74 @@ def glob(pattern: str, path: NullableStr = None) -> str:
     if not search_path.exists():
         raise FileNotFoundError(f"Directory not found: {path}")
 
-    matches = sorted(search_path.glob(pattern))
+    matches = sorted(
+        _iter_paths(search_path, pattern), key=lambda m: os.path.normcase(m).split(os.sep)
+    )
 
     if not matches:
         return f"No files matching '{pattern}'"
 
-    return "\n".join(str(m) for m in matches[:100])
+    return "\n".join(matches[:100])
+
+
+_REGEX_META = frozenset(".^$*+?{}[]\\|()")
+
+
+def _literal_bytes(pattern: str) -> bytes | None:
+    if not pattern or "\ufffd" in pattern or not _REGEX_META.isdisjoint(pattern):
+        return None
+    try:
+        return pattern.encode("utf-8")
+    except UnicodeEncodeError:
+        return None
+
+
+def _grep_file(file_path: str, regex: re.Pattern[str], literal: bytes | None) -> list[str]:
+    try:
+        with open(file_path, "rb") as f:
+            raw = f.read()
+    except Exception:
+        return []
+
+    if literal is not None and literal not in raw:
+        return []
+
+    content = raw.decode("utf-8", errors="replace")
+
+    matches = []
+    for i, line in enumerate(content.splitlines(), 1):
+        if regex.search(line):
+            matches.append(f"{file_path}:{i}: {line.strip()}")
+            if len(matches) >= 100:
+                break
+    return matches
+
+
+def _grep_files(search_path: Path, file_glob: str, regex: re.Pattern[str]) -> list[str]:
+    files = _iter_paths(search_path, file_glob, files_only=True)
+    scan = partial(_grep_file, regex=regex, literal=_literal_bytes(regex.pattern))
+    results: list[str] = []
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        pending = deque(executor.submit(scan, f) for f in islice(files, 32))
+        while pending:
+            results.extend(pending.popleft().result())
+            if len(results) >= 100:
+                for future in pending:
+                    future.cancel()
+                del results[100:]
+                results.append("... (truncated)")
+                break
+
+            next_file = next(files, None)
+            if next_file is not None:
+                pending.append(executor.submit(scan, next_file))
+
+    return results
 
 
 @tool
-def grep(pattern: str, path: NullableStr = None, file_glob: str = "**/*") -> str:
+async def grep(pattern: str, path: NullableStr = None, file_glob: str = "**/*") -> str:
     """Search for a regex pattern in files."""
     search_path = Path(path or os.getcwd()).expanduser().resolve()
 
@@ -170,23 +292,7 @@ def grep(pattern: str, path: NullableStr = None, file_glob: str = "**/*") -> str
         raise FileNotFoundError(f"Directory not found: {path}")
 
     regex = re.compile(pattern)
-    results = []
-
-    for file_path in search_path.glob(file_glob):
-        if not file_path.is_file():
-            continue
-
-        try:
-            content = file_path.read_text(encoding="utf-8", errors="replace")
-            for i, line in enumerate(content.splitlines(), 1):
-                if regex.search(line):
-                    results.append(f"{file_path}:{i}: {line.strip()}")
-
-                    if len(results) >= 100:
-                        results.append("... (truncated)")
-                        return "\n".join(results)
-        except Exception:
-            continue
+    results = await asyncio.to_thread(_grep_files, search_path, file_glob, regex)
 
     if not results:
         return f"No matches for '{pattern}'"
@@ -1,6 +1,9 @@
+import asyncio
 import httpx
 import json
 
+from http.cookiejar import CookieJar
+from http.cookiejar import DefaultCookiePolicy
 from typing import Any
 from typing import Literal
 
@@ -10,6 +13,30 @@ from osso.types import NullableStr
 from markdownify import markdownify
 from duckduckgo_search import DDGS as _DDGS
 
+_MAX_FETCH_BYTES = 2_000_000
+
+_clients: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+
+def _get_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        for stale in [other for other in _clients if other.is_closed()]:
+            del _clients[stale]
+        client = httpx.AsyncClient(
+            cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=128),
+        )
+        _clients[loop] = client
+    return client
+
+
+async def close_web_clients() -> None:
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
 
 @tool
 async def web_fetch(url: str, extract: NullableStr = None, timeout: int = 30) -> str:
@@ -19,24 +46,48 @@ async def web_fetch(url: str, extract: NullableStr = None, timeout: int = 30) ->
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
     }
 
-    async with httpx.AsyncClient(follow_redirects=True, timeout=timeout) as client:
-        response = await client.get(url, headers=headers)
-        response.raise_for_status()
+    client = _get_client()
+    cookies = httpx.Cookies()
+    request = client.build_request("GET", url, headers=headers, timeout=timeout)
+    for _ in range(client.max_redirects + 1):
+        cookies.set_cookie_header(request)
+        response = await client.send(request, stream=True)
+        cookies.extract_cookies(response)
+        if response.next_request is None:
+            break
+        await response.aclose()
+        request = response.next_request
+    else:
+        raise httpx.TooManyRedirects("Exceeded maximum allowed redirects.", request=request)
 
     content_type = response.headers.get("content-type", "")
+    max_bytes = None if "application/json" in content_type else _MAX_FETCH_BYTES
+
+    try:
+        response.raise_for_status()
+        body = bytearray()
+        async for chunk in response.aiter_bytes():
+            body.extend(chunk)
+            if max_bytes is not None and len(body) >= max_bytes:
+                break
+    finally:
+        await response.aclose()
+
+    content = body[:max_bytes].decode(response.encoding or "utf-8", errors="replace")
 
     if "application/json" in content_type:
         try:
-            data = response.json()
+            data = json.loads(content)
             return json.dumps(data, indent=2)[:50000]
         except Exception:
-            return response.text[:50000]
+            return content[:50000]
 
     if "text/plain" in content_type:
-        return response.text[:50000]
+        return content[:50000]
 
-    html = response.text
-    text = markdownify(html, heading_style="ATX", strip=["script", "style"])
+    text = await asyncio.to_thread(
+        markdownify, content, heading_style="ATX", strip=["script", "style"]
+    )
 
     text = text[:50000]
 
@@ -78,13 +129,17 @@ async def http_request(
     """Make HTTP requests to APIs. Supports GET, POST, PUT, PATCH, DELETE."""
     request_headers = headers or {}
 
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        if isinstance(body, dict):
-            response = await client.request(method, url, headers=request_headers, json=body)
-        elif isinstance(body, str):
-            response = await client.request(method, url, headers=request_headers, content=body)
-        else:
-            response = await client.request(method, url, headers=request_headers)
+    client = _get_client()
+    if isinstance(body, dict):
+        response = await client.request(
+            method, url, headers=request_headers, json=body, timeout=timeout
+        )
+    elif isinstance(body, str):
+        response = await client.request(
+            method, url, headers=request_headers, content=body, timeout=timeout
+        )
+    else:
+        response = await client.request(method, url, headers=request_headers, timeout=timeout)
 
     output = [
         f"HTTP {response.status_code} {response.reason_phrase}",
@@ -14,38 +14,39 @@ from typing import Union
 from typing import AsyncIterator
 
 from pydantic import BaseModel
+from pydantic import ConfigDict
 
 
 type NullableStr = str | None
 
 
-@dataclass
+@dataclass(slots=True)
 class TextContent:
     type: Literal["text"]
     text: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ImageContent:
     type: Literal["image"]
     source: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCall:
     id: str
     name: str
     arguments: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult:
     id: str
     content: str
     is_error: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Tool:
     name: str
     description: str
@@ -53,7 +54,7 @@ class Tool:
     handler: Callable
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     role: Literal["user", "assistant", "system"]
     content: str | list[Content] | None = None
@@ -61,7 +62,7 @@ class Message:
     tool_results: list[ToolResult] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Response:
     content: NullableStr = None
     tool_calls: list[ToolCall] = field(default_factory=list)
@@ -117,11 +118,15 @@ class Messages:
 
 
 class QuestionOption(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     label: str
     description: str
 
 
 class Question(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     question: str
     header: str
     options: list[QuestionOption]
@@ -131,7 +136,7 @@ class Question(BaseModel):
 Content = Union[TextContent, ImageContent]
 
 
-@dataclass
+@dataclass(slots=True)
 class Request:
     messages: list[Message]
     id: str
@@ -141,20 +146,20 @@ class Request:
     temperature: float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TextDelta:
     id: str
     text: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCallStart:
     id: str
     request_id: str
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCallEnd:
     id: str
     request_id: str
@@ -162,19 +167,19 @@ class ToolCallEnd:
     arguments: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class Done:
     id: str
     response: Response
 
 
-@dataclass
+@dataclass(slots=True)
 class Error:
     id: str
     error: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Session:
     _inbox: asyncio.Queue[Request | None]
     _outbox: asyncio.Queue[Event]
@@ -196,14 +201,14 @@ class Session:
 Event = TextDelta | ToolCallStart | ToolCallEnd | Done | Error
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentEvent:
     type: str
     data: dict[str, Any] = field(default_factory=dict)
     timestamp: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass
+@dataclass(slots=True)
 class Checkpoint:
     agent_id: str
     run_id: str
@@ -0,0 +1,34 @@
+from osso import grep
+
+
+async def test_grep_literal(tmp_path):
+    (tmp_path / "a.py").write_text("import os\nfoo = 1\n")
+    (tmp_path / "b.py").write_text("bar = 2\n")
+
+    result = await grep(pattern="foo", path=str(tmp_path))
+
+    assert result == f"{tmp_path / 'a.py'}:2: foo = 1"
+
+
+async def test_grep_no_match(tmp_path):
+    (tmp_path / "a.py").write_text("import os\n")
+
+    result = await grep(pattern="foo", path=str(tmp_path))
+
+    assert result == "No matches for 'foo'"
+
+
+async def test_grep_multiline_pattern_is_searched_per_line(tmp_path):
+    (tmp_path / "a.txt").write_text("x = 1\n" * 10000)
+
+    result = await grep(pattern=r"[\s\S]*?;", path=str(tmp_path))
+
+    assert result == "No matches for '[\\s\\S]*?;'"
+
+
+async def test_grep_lone_surrogate(tmp_path):
+    (tmp_path / "a.py").write_text("import os\n")
+
+    result = await grep(pattern="\ud800x", path=str(tmp_path))
+
+    assert result == "No matches for '\ud800x'"
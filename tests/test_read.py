@@ -0,0 +1,19 @@
+from osso import read
+
+
+def test_read_window(tmp_path):
+    path = tmp_path / "a.txt"
+    path.write_text("".join(f"line {i}\n" for i in range(1, 100001)))
+
+    result = read(str(path), offset=99998, limit=5)
+
+    assert result == " 99999\tline 99999\n100000\tline 100000"
+
+
+def test_read_universal_newlines(tmp_path):
+    path = tmp_path / "a.txt"
+    path.write_bytes(b"one\rtwo\r\nthree")
+
+    result = read(str(path))
+
+    assert result == "     1\tone\n     2\ttwo\n     3\tthree"